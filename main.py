@@ -28,20 +28,24 @@ def main():
         "GOOGLE_API_KEY",
     ]
 
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    # Set-but-empty variables count as missing
+    required = frozenset(required_vars)
+    configured = {var for var in required & os.environ.keys() if os.environ[var]}
+    missing = required - configured
 
-    if missing_vars:
+    if missing:
         print("Missing required environment variables:")
-        for var in missing_vars:
-            print(f"   - {var}")
+        for var in required_vars:
+            if var in missing:
+                print(f"   - {var}")
         print()
         print("Please configure these in .env.credentials")
         exit(1)
 
     print("Environment variables configured:")
     for var in required_vars:
-        value = os.getenv(var)
-        masked = value[:8] + "..." if value and len(value) > 8 else "***"
+        value = os.environ[var]
+        masked = value[:8] + "..." if len(value) > 8 else "***"
         print(f"   {var}: {masked}")
 
     print()
@@ -1,20 +1,24 @@
 """
 Production Logistics Skills for IBM watsonx Orchestrate
 Simplified two-agent workshop: Data tools and Communication tools
+
+Tool modules are imported lazily on first attribute access, so importing the
+package does not pull in the SDK clients until a tool is actually used.
 """
+from importlib import import_module
 
-from skills.data import (
-    get_schedule,
-    search_inventory,
-    check_availability,
-    create_reservation,
-)
+_DATA_TOOLS = frozenset({
+    "get_schedule",
+    "search_inventory",
+    "check_availability",
+    "create_reservation",
+})
 
-from skills.communications import (
-    post_briefing,
-    send_approval_request,
-    place_order,
-)
+_COMM_TOOLS = frozenset({
+    "post_briefing",
+    "send_approval_request",
+    "place_order",
+})
 
 __all__ = [
     # Data tools
@@ -27,3 +31,19 @@ __all__ = [
     "send_approval_request",
     "place_order",
 ]
+
+
+def __getattr__(name):
+    if name in _DATA_TOOLS:
+        module = import_module("skills.data")
+    elif name in _COMM_TOOLS:
+        module = import_module("skills.communications")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,15 +6,32 @@ Tools:
 - send_approval_request: Send interactive approval buttons
 - place_order: Execute mock procurement order
 """
+import json
+import time
+import zlib
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Optional
+import orjson
 from pydantic import BaseModel, Field
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+from slack_sdk.web import base_client as slack_base_client
 from ibm_watsonx_orchestrate.agent_builder.tools import tool
 from ibm_watsonx_orchestrate.agent_builder.connections import ConnectionType
 from ibm_watsonx_orchestrate.run import connections
 
+# Route slack_sdk's request/response JSON through orjson. The base client only
+# uses json.dumps, json.loads and json.decoder.JSONDecodeError (which
+# orjson.JSONDecodeError subclasses), so a namespace with those suffices.
+slack_base_client.json = SimpleNamespace(
+    dumps=lambda obj: orjson.dumps(obj).decode(),
+    loads=orjson.loads,
+    decoder=json.decoder,
+)
+
 
 # =============================================================================
 # Pydantic Models
@@ -84,6 +101,70 @@ class OrderOutput(BaseModel):
     error: Optional[str] = None
 
 
+# =============================================================================
+# Slack Block Kit Templates
+# =============================================================================
+
+# Static blocks are built once at import; only the dynamic leaves vary per call
+_BRIEFING_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "Production Update"
+    }
+}
+
+_APPROVAL_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "Approval Required"
+    }
+}
+
+_APPROVE_TEXT = {"type": "plain_text", "text": "Approve"}
+_DENY_TEXT = {"type": "plain_text", "text": "Deny"}
+
+
+def _section_block(text: str) -> dict:
+    """Build a mrkdwn section block."""
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def _context_block(text: str) -> dict:
+    """Build a context block with a single mrkdwn element."""
+    return {"type": "context", "elements": [{"type": "mrkdwn", "text": text}]}
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _slack_client() -> tuple[WebClient, Optional[str]]:
+    """Return a shared Slack client and the configured default channel."""
+    slack_conn = connections.key_value("gcsc_slack_api")
+    slack_client = WebClient(token=slack_conn.get('token'))
+    # Posts aren't idempotent, so only retry 429s (honouring Retry-After)
+    slack_client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=3))
+    return slack_client, slack_conn.get('channel_id')
+
+
+_stamp_cache: dict = {"minute": None, "stamp": ""}
+
+
+def _minute_stamp() -> str:
+    """Return the current local time as 'YYYY-MM-DD HH:MM', formatted once per minute."""
+    now = time.time()
+    minute = int(now // 60)
+    if minute != _stamp_cache["minute"]:
+        _stamp_cache.update(
+            minute=minute,
+            stamp=datetime.fromtimestamp(now).strftime('%Y-%m-%d %H:%M')
+        )
+    return _stamp_cache["stamp"]
+
+
 # =============================================================================
 # Tools
 # =============================================================================
@@ -103,37 +184,18 @@ def post_briefing(input: BriefingInput) -> BriefingOutput:
     """
     Sends a formatted briefing message to Slack.
     """
-    slack_conn = connections.key_value("gcsc_slack_api")
-    slack_client = WebClient(token=slack_conn.get('token'))
+    slack_client, default_channel = _slack_client()
 
     message = input.message
-    channel_id = input.channel_id or slack_conn.get('channel_id')
+    channel_id = input.channel_id or default_channel
 
     try:
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "Production Update"
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": message
-                }
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"Posted by Production Assistant | {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-                    }
-                ]
-            }
+            _BRIEFING_HEADER,
+            _section_block(message),
+            _context_block(
+                f"Posted by Production Assistant | {_minute_stamp()}"
+            )
         ]
 
         response = slack_client.chat_postMessage(
@@ -142,7 +204,7 @@ def post_briefing(input: BriefingInput) -> BriefingOutput:
             blocks=blocks
         )
 
-        return BriefingOutput(
+        return BriefingOutput.model_construct(
             posted=True,
             message_ts=response["ts"],
             channel=response["channel"],
@@ -150,7 +212,7 @@ def post_briefing(input: BriefingInput) -> BriefingOutput:
         )
 
     except SlackApiError as e:
-        return BriefingOutput(
+        return BriefingOutput.model_construct(
             posted=False,
             status="error",
             error=str(e.response["error"])
@@ -173,65 +235,46 @@ def send_approval_request(input: ApprovalInput) -> ApprovalOutput:
     """
     Sends a Slack message with approval buttons for budget items.
     """
-    slack_conn = connections.key_value("gcsc_slack_api")
-    slack_client = WebClient(token=slack_conn.get('token'))
+    slack_client, default_channel = _slack_client()
 
     item_description = input.item_description
     total_cost = input.total_cost
     scene_number = input.scene_number
-    channel_id = input.channel_id or slack_conn.get('channel_id')
+    channel_id = input.channel_id or default_channel
 
     try:
         scene_text = f"\n*Scene:* {scene_number}" if scene_number else ""
 
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "Approval Required"
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": (
-                        f"*Item:* {item_description}\n"
-                        f"*Total Cost:* ${total_cost:.2f}"
-                        f"{scene_text}\n"
-                        f"*Requested by:* Production Assistant"
-                    )
-                }
-            },
+            _APPROVAL_HEADER,
+            _section_block(
+                f"*Item:* {item_description}\n"
+                f"*Total Cost:* ${total_cost:.2f}"
+                f"{scene_text}\n"
+                f"*Requested by:* Production Assistant"
+            ),
             {
                 "type": "actions",
                 "elements": [
                     {
                         "type": "button",
-                        "text": {"type": "plain_text", "text": "Approve"},
+                        "text": _APPROVE_TEXT,
                         "style": "primary",
                         "value": f"approve_{item_description}",
                         "action_id": "approve_purchase"
                     },
                     {
                         "type": "button",
-                        "text": {"type": "plain_text", "text": "Deny"},
+                        "text": _DENY_TEXT,
                         "style": "danger",
                         "value": f"deny_{item_description}",
                         "action_id": "deny_purchase"
                     }
                 ]
             },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"Approval threshold: $100 | Requested at {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-                    }
-                ]
-            }
+            _context_block(
+                f"Approval threshold: $100 | Requested at {_minute_stamp()}"
+            )
         ]
 
         response = slack_client.chat_postMessage(
@@ -240,7 +283,7 @@ def send_approval_request(input: ApprovalInput) -> ApprovalOutput:
             blocks=blocks
         )
 
-        return ApprovalOutput(
+        return ApprovalOutput.model_construct(
             sent=True,
             message_ts=response["ts"],
             channel=response["channel"],
@@ -250,7 +293,7 @@ def send_approval_request(input: ApprovalInput) -> ApprovalOutput:
         )
 
     except SlackApiError as e:
-        return ApprovalOutput(
+        return ApprovalOutput.model_construct(
             sent=False,
             item_description=item_description,
             total_cost=total_cost,
@@ -277,11 +320,11 @@ def place_order(input: OrderInput) -> OrderOutput:
 
     try:
         # Generate mock order details
-        order_id = f"PO-{datetime.now().strftime('%Y%m%d')}-{abs(hash(item_name)) % 10000:04d}"
+        order_id = f"PO-{datetime.now().strftime('%Y%m%d')}-{zlib.crc32(item_name.encode()) % 10000:04d}"
         total_cost = unit_cost * quantity
         estimated_delivery = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
 
-        return OrderOutput(
+        return OrderOutput.model_construct(
             order_placed=True,
             order_id=order_id,
             item_name=item_name,
@@ -293,7 +336,7 @@ def place_order(input: OrderInput) -> OrderOutput:
         )
 
     except Exception as e:
-        return OrderOutput(
+        return OrderOutput.model_construct(
             order_placed=False,
             item_name=item_name,
             quantity=quantity,
@@ -7,11 +7,21 @@ Tools:
 - check_availability: Check real-time availability for asset/date
 - create_reservation: Create allocation and update scene status
 """
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Optional
+import backoff
+import httpx
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict, Field
 from notion_client import Client as NotionClient
-from pyairtable import Api as AirtableApi
+from notion_client.errors import HTTPResponseError
+from pyairtable import Api as AirtableApi, Table, retry_strategy
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError
 from ibm_watsonx_orchestrate.agent_builder.tools import tool, ToolPermission
 from ibm_watsonx_orchestrate.agent_builder.connections import ConnectionType
 from ibm_watsonx_orchestrate.run import connections
@@ -34,6 +44,8 @@ class ScheduleInput(BaseModel):
 
 class SceneData(BaseModel):
     """Data for a single scene from Notion."""
+    model_config = ConfigDict(defer_build=True)
+
     scene_id: str
     scene_number: str
     shoot_date: str
@@ -67,6 +79,8 @@ class SearchInput(BaseModel):
 
 class AssetData(BaseModel):
     """Data for a single asset from Airtable."""
+    model_config = ConfigDict(defer_build=True)
+
     asset_name: str
     total_quantity: int = 0
     daily_rate: float = 0.0
@@ -130,16 +144,147 @@ class ReservationOutput(BaseModel):
     error: Optional[str] = None
 
 
+# Notion properties read by get_schedule; everything else is projected away
+_SCENE_PROPERTIES = (
+    "Scene Number",
+    "Shoot Date",
+    "Script Breakdown",
+    "Est. Budget",
+    "Logistics Status",
+)
+
+# Shared read-only defaults so missing properties don't allocate per row
+_EMPTY = MappingProxyType({})
+_EMPTY_TITLE = (_EMPTY,)
+
+# Keep-alive connection pool size for the shared Notion and Airtable clients
+_HTTP_POOL_SIZE = 32
+
+# Worker threads for overlapping independent API calls within one tool call;
+# check_availability submits its asset lookup and reservation sum here
+_EXECUTOR_WORKERS = 4
+_executor = ThreadPoolExecutor(max_workers=_EXECUTOR_WORKERS)
+
+# Asset name -> Airtable record; assets change rarely so lookups are cached
+# (TTLCache isn't thread-safe and lookups run on worker threads, hence the lock)
+_asset_cache: TTLCache = TTLCache(maxsize=1024, ttl=600)
+_asset_cache_lock = threading.Lock()
+
+# Airtable Assets column -> AssetData field; also the projection sent to Airtable
+_ASSET_COLUMNS = {
+    "Asset Name": "asset_name",
+    "Total Quantity": "total_quantity",
+    "Daily Rate": "daily_rate",
+    "Category": "category",
+    "Maintenance Status": "maintenance_status",
+}
+_ASSET_FIELDS = list(_ASSET_COLUMNS)
+
+# Escapes backslashes and single quotes for Airtable formula string literals
+_FORMULA_ESCAPE = str.maketrans({"'": "\\'", "\\": "\\\\"})
+
+# Airtable formula templates; values are substituted already quoted by _quote()
+_SEARCH_FORMULA = "FIND(LOWER({query}), LOWER({{Asset Name}})) > 0"
+_ASSET_BY_NAME_FORMULA = "{{Asset Name}}={name}"
+# Linked records evaluate to the linked rows' primary field (Asset Name) in
+# formulas, so allocations can be matched by name without the asset record ID.
+_ALLOCATIONS_ON_DATE_FORMULA = (
+    "AND("
+    "FIND(','&{name}&',', ','&ARRAYJOIN({{Asset Link}}, ',')&','),"
+    "{{Start Date}}={date},"
+    "OR({{Status}}='Confirmed',{{Status}}='Pending')"
+    ")"
+)
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
+def _quote(value: str) -> str:
+    """Render a value as a single-quoted Airtable formula string literal."""
+    return f"'{value.translate(_FORMULA_ESCAPE)}'"
+
+
+def _is_transient(e: Exception) -> bool:
+    """True for rate-limit (429) and server-side (5xx) API errors."""
+    status = getattr(e, "status", None)
+    if status is None:
+        status = getattr(getattr(e, "response", None), "status_code", None)
+    return status is not None and (status == 429 or status >= 500)
+
+
+@backoff.on_exception(
+    backoff.expo,
+    (HTTPError, HTTPResponseError),
+    max_tries=3,
+    giveup=lambda e: not _is_transient(e)
+)
+def _with_retry(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call an idempotent Notion/Airtable request, retrying transient failures."""
+    return func(*args, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _notion() -> tuple[NotionClient, Optional[str]]:
+    """Return a shared Notion client and the configured database ID."""
+    notion_conn = connections.key_value("gcsc_notion_api")
+    http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=_HTTP_POOL_SIZE,
+            max_keepalive_connections=_HTTP_POOL_SIZE
+        )
+    )
+    notion = NotionClient(auth=notion_conn.get('token'), client=http_client)
+    return notion, notion_conn.get('database_id')
+
+
+@lru_cache(maxsize=1)
+def _scene_property_ids() -> tuple[str, ...]:
+    """Resolve the Notion property IDs for _SCENE_PROPERTIES."""
+    notion, database_id = _notion()
+    properties = _with_retry(notion.data_sources.retrieve, data_source_id=database_id)["properties"]
+    return tuple(properties[name]["id"] for name in _SCENE_PROPERTIES if name in properties)
+
+
+@lru_cache(maxsize=1)
+def _airtable() -> tuple[AirtableApi, Optional[str]]:
+    """Return a shared Airtable client and the configured base ID."""
+    airtable_conn = connections.key_value("gcsc_airtable_api")
+    airtable_api = AirtableApi(airtable_conn.get('token'))
+    # Replaces pyairtable's default adapter; keep its 429 retry strategy
+    airtable_api.session.mount("https://", HTTPAdapter(
+        pool_connections=_HTTP_POOL_SIZE,
+        pool_maxsize=_HTTP_POOL_SIZE,
+        max_retries=retry_strategy()
+    ))
+    return airtable_api, airtable_conn.get('base_id')
+
+
+@lru_cache(maxsize=1)
+def _assets_table() -> Table:
+    """Return the Airtable Assets table bound to the shared client."""
+    airtable_api, base_id = _airtable()
+    return airtable_api.table(base_id, "Assets")
+
+
+@lru_cache(maxsize=1)
+def _allocations_table() -> Table:
+    """Return the Airtable Allocations table bound to the shared client."""
+    airtable_api, base_id = _airtable()
+    return airtable_api.table(base_id, "Allocations")
+
+
 def _extract_rich_text(field: dict) -> str:
     """Extract plain text from Notion rich_text field."""
-    if not field or field.get("type") != "rich_text":
+    if not field:
+        return ""
+    rich_text_list = field.get("rich_text")
+    if not rich_text_list:
         return ""
-    rich_text_list = field.get("rich_text", [])
-    return "".join([block.get("plain_text", "") for block in rich_text_list])
+    if len(rich_text_list) == 1:
+        return rich_text_list[0].get("plain_text", "")
+    return "".join(block.get("plain_text", "") for block in rich_text_list)
 
 
 def _extract_select(field: dict, default: str = "") -> str:
@@ -152,6 +297,73 @@ def _extract_select(field: dict, default: str = "") -> str:
     return select_value.get("name", default)
 
 
+def _lookup_asset(asset_name: str, use_cache: bool = True) -> Optional[dict]:
+    """
+    Return the Airtable Assets record for an exact name, or None if missing.
+    Pass use_cache=False to always fetch (and re-cache) the current record.
+    """
+    record = None
+    if use_cache:
+        with _asset_cache_lock:
+            record = _asset_cache.get(asset_name)
+    if record is None:
+        records = _with_retry(
+            _assets_table().all,
+            formula=_ASSET_BY_NAME_FORMULA.format(name=_quote(asset_name)),
+            max_records=1
+        )
+        if not records:
+            return None
+        record = records[0]
+        with _asset_cache_lock:
+            _asset_cache[asset_name] = record
+    return record
+
+
+def _sum_reserved(allocation_formula: str) -> int:
+    """Fold Quantity Reserved over matching allocations one page at a time."""
+    reserved = 0
+    for page in _allocations_table().iterate(
+        formula=allocation_formula, page_size=100, fields=["Quantity Reserved"]
+    ):
+        reserved += sum(r["fields"].get("Quantity Reserved", 0) for r in page)
+    return reserved
+
+
+def _reserved_on_date(asset_name: str, shoot_date: str) -> int:
+    """Sum the quantity of active (Confirmed/Pending) allocations of an asset on a date."""
+    allocation_formula = _ALLOCATIONS_ON_DATE_FORMULA.format(
+        name=_quote(asset_name), date=_quote(shoot_date)
+    )
+    return _with_retry(_sum_reserved, allocation_formula)
+
+
+def _lookup_asset_and_reserved(
+    asset_name: str, shoot_date: str
+) -> tuple[Optional[dict], int]:
+    """Look up the asset and its reserved quantity on the date concurrently."""
+    asset_future = _executor.submit(_lookup_asset, asset_name)
+    reserved_future = _executor.submit(_reserved_on_date, asset_name, shoot_date)
+    return asset_future.result(), reserved_future.result()
+
+
+def _update_scene_status(scene_id: str, total_cost: float) -> bool:
+    """Mark a Notion scene as Reserved with its budget; returns success."""
+    notion, _ = _notion()
+    try:
+        _with_retry(
+            notion.pages.update,
+            page_id=scene_id,
+            properties={
+                "Logistics Status": {"select": {"name": "Reserved"}},
+                "Est. Budget": {"number": total_cost}
+            }
+        )
+        return True
+    except Exception:
+        return False  # Continue even if Notion update fails
+
+
 # =============================================================================
 # Tools
 # =============================================================================
@@ -174,40 +386,46 @@ def get_schedule(input: ScheduleInput) -> ScheduleOutput:
     """
     days_ahead = input.days_ahead
 
-    notion_conn = connections.key_value("gcsc_notion_api")
-    notion = NotionClient(auth=notion_conn.get('token'))
-    database_id = notion_conn.get('database_id')
+    notion, database_id = _notion()
 
     today = datetime.now().date()
     end_date = today + timedelta(days=days_ahead)
 
     try:
-        response = notion.data_sources.query(
-            **{
-                "data_source_id": database_id,
-                "filter": {
-                    "and": [
-                        {"property": "Shoot Date", "date": {"on_or_after": today.isoformat()}},
-                        {"property": "Shoot Date", "date": {"on_or_before": end_date.isoformat()}}
-                    ]
-                },
-                "sorts": [{"property": "Shoot Date", "direction": "ascending"}]
-            }
-        )
+        query = {
+            "data_source_id": database_id,
+            "filter": {
+                "and": [
+                    {"property": "Shoot Date", "date": {"on_or_after": today.isoformat()}},
+                    {"property": "Shoot Date", "date": {"on_or_before": end_date.isoformat()}}
+                ]
+            },
+            "sorts": [{"property": "Shoot Date", "direction": "ascending"}]
+        }
+        property_ids = _scene_property_ids()
+        if property_ids:
+            query["filter_properties"] = list(property_ids)
+
+        response = _with_retry(notion.data_sources.query, **query)
 
         scenes = []
-        for page in response.get("results", []):
+        for page in response.get("results", ()):
             props = page["properties"]
-            scenes.append(SceneData(
+            scene_number = props.get("Scene Number", _EMPTY)
+            shoot_date = props.get("Shoot Date", _EMPTY)
+            script_breakdown = props.get("Script Breakdown", _EMPTY)
+            est_budget = props.get("Est. Budget", _EMPTY)
+            logistics_status = props.get("Logistics Status", _EMPTY)
+            scenes.append(SceneData.model_construct(
                 scene_id=page["id"],
-                scene_number=props.get("Scene Number", {}).get("title", [{}])[0].get("plain_text", "N/A"),
-                shoot_date=props.get("Shoot Date", {}).get("date", {}).get("start", "Unknown"),
-                script_breakdown=_extract_rich_text(props.get("Script Breakdown", {})),
-                est_budget=props.get("Est. Budget", {}).get("number"),
-                logistics_status=_extract_select(props.get("Logistics Status", {}), "Pending")
+                scene_number=scene_number.get("title", _EMPTY_TITLE)[0].get("plain_text", "N/A"),
+                shoot_date=shoot_date.get("date", _EMPTY).get("start", "Unknown"),
+                script_breakdown=_extract_rich_text(script_breakdown),
+                est_budget=est_budget.get("number"),
+                logistics_status=_extract_select(logistics_status, "Pending")
             ))
 
-        return ScheduleOutput(
+        return ScheduleOutput.model_construct(
             scenes=scenes,
             date_range={"start": today.isoformat(), "end": end_date.isoformat()},
             total_scenes=len(scenes),
@@ -215,7 +433,7 @@ def get_schedule(input: ScheduleInput) -> ScheduleOutput:
         )
 
     except Exception as e:
-        return ScheduleOutput(
+        return ScheduleOutput.model_construct(
             date_range={"start": today.isoformat(), "end": end_date.isoformat()},
             status="error",
             error=str(e)
@@ -241,30 +459,27 @@ def search_inventory(input: SearchInput) -> SearchOutput:
     query = input.query.strip()
     max_results = input.max_results
 
-    airtable_conn = connections.key_value("gcsc_airtable_api")
-    airtable_api = AirtableApi(airtable_conn.get('token'))
-    base_id = airtable_conn.get('base_id')
-
     try:
-        table = airtable_api.table(base_id, "Assets")
-        escaped_query = query.replace("'", "\\'")
-        formula = f"FIND(LOWER('{escaped_query}'), LOWER({{Asset Name}})) > 0"
-
-        records = table.all(formula=formula, max_records=max_results, sort=["Asset Name"])
+        table = _assets_table()
+        formula = _SEARCH_FORMULA.format(query=_quote(query))
+
+        records = _with_retry(
+            table.all,
+            formula=formula,
+            max_records=max_results,
+            sort=["Asset Name"],
+            fields=_ASSET_FIELDS
+        )
 
+        # Only projected columns come back, so each row is a single rename pass;
+        # AssetData defaults fill in any blank cells.
         assets = []
         for record in records:
-            fields = record["fields"]
-            assets.append(AssetData(
-                asset_name=fields.get("Asset Name", "Unknown"),
-                total_quantity=fields.get("Total Quantity", 0),
-                daily_rate=fields.get("Daily Rate", 0.0),
-                category=fields.get("Category", "N/A"),
-                maintenance_status=fields.get("Maintenance Status", "Unknown"),
-                record_id=record["id"]
-            ))
+            row = {_ASSET_COLUMNS[column]: value for column, value in record["fields"].items()}
+            row.setdefault("asset_name", "Unknown")
+            assets.append(AssetData.model_construct(record_id=record["id"], **row))
 
-        return SearchOutput(
+        return SearchOutput.model_construct(
             assets=assets,
             query=query,
             items_found=len(assets),
@@ -272,7 +487,7 @@ def search_inventory(input: SearchInput) -> SearchOutput:
         )
 
     except Exception as e:
-        return SearchOutput(query=query, status="error", error=str(e))
+        return SearchOutput.model_construct(query=query, status="error", error=str(e))
 
 
 @tool(
@@ -296,18 +511,12 @@ def check_availability(input: AvailabilityInput) -> AvailabilityOutput:
     asset_name = input.asset_name.strip()
     shoot_date = input.shoot_date
 
-    airtable_conn = connections.key_value("gcsc_airtable_api")
-    airtable_api = AirtableApi(airtable_conn.get('token'))
-    base_id = airtable_conn.get('base_id')
-
     try:
-        # Get asset info
-        assets_table = airtable_api.table(base_id, "Assets")
-        escaped_name = asset_name.replace("'", "\\'")
-        asset_records = assets_table.all(formula=f"{{Asset Name}}='{escaped_name}'", max_records=1)
+        # Get asset info and allocations for this date
+        asset_record, reserved = _lookup_asset_and_reserved(asset_name, shoot_date)
 
-        if not asset_records:
-            return AvailabilityOutput(
+        if asset_record is None:
+            return AvailabilityOutput.model_construct(
                 asset_name=asset_name,
                 shoot_date=shoot_date,
                 asset_found=False,
@@ -315,26 +524,13 @@ def check_availability(input: AvailabilityInput) -> AvailabilityOutput:
                 error=f"Asset '{asset_name}' not found"
             )
 
-        asset_fields = asset_records[0]["fields"]
-        asset_record_id = asset_records[0]["id"]
+        asset_fields = asset_record["fields"]
         total_owned = asset_fields.get("Total Quantity", 0)
         daily_rate = asset_fields.get("Daily Rate", 0.0)
 
-        # Get allocations for this date
-        allocations_table = airtable_api.table(base_id, "Allocations")
-        allocation_formula = (
-            f"AND("
-            f"FIND('{asset_record_id}', ARRAYJOIN({{Asset Link}})),"
-            f"{{Start Date}}='{shoot_date}',"
-            f"OR({{Status}}='Confirmed',{{Status}}='Pending')"
-            f")"
-        )
-        allocation_records = allocations_table.all(formula=allocation_formula)
-
-        reserved = sum(r["fields"].get("Quantity Reserved", 0) for r in allocation_records)
         available = total_owned - reserved
 
-        return AvailabilityOutput(
+        return AvailabilityOutput.model_construct(
             asset_name=asset_name,
             shoot_date=shoot_date,
             total_owned=total_owned,
@@ -347,7 +543,7 @@ def check_availability(input: AvailabilityInput) -> AvailabilityOutput:
         )
 
     except Exception as e:
-        return AvailabilityOutput(
+        return AvailabilityOutput.model_construct(
             asset_name=asset_name,
             shoot_date=shoot_date,
             status="error",
@@ -379,21 +575,13 @@ def create_reservation(input: ReservationInput) -> ReservationOutput:
     shoot_date = input.shoot_date
     quantity = input.quantity
 
-    airtable_conn = connections.key_value("gcsc_airtable_api")
-    airtable_api = AirtableApi(airtable_conn.get('token'))
-    base_id = airtable_conn.get('base_id')
-
-    notion_conn = connections.key_value("gcsc_notion_api")
-    notion = NotionClient(auth=notion_conn.get('token'))
-
     try:
-        # Step 1: Look up asset record ID
-        assets_table = airtable_api.table(base_id, "Assets")
-        escaped_name = asset_name.replace("'", "\\'")
-        asset_records = assets_table.all(formula=f"{{Asset Name}}='{escaped_name}'", max_records=1)
+        # Step 1: Look up asset record ID; bypass the cache so the Daily Rate
+        # written to Notion as the budget is current
+        asset_record = _lookup_asset(asset_name, use_cache=False)
 
-        if not asset_records:
-            return ReservationOutput(
+        if asset_record is None:
+            return ReservationOutput.model_construct(
                 reservation_created=False,
                 asset_name=asset_name,
                 scene_number=scene_number,
@@ -403,13 +591,12 @@ def create_reservation(input: ReservationInput) -> ReservationOutput:
                 error=f"Asset '{asset_name}' not found"
             )
 
-        asset_record_id = asset_records[0]["id"]
-        daily_rate = asset_records[0]["fields"].get("Daily Rate", 0.0)
+        asset_record_id = asset_record["id"]
+        daily_rate = asset_record["fields"].get("Daily Rate", 0.0)
         total_cost = daily_rate * quantity
 
         # Step 2: Create allocation in Airtable
-        allocations_table = airtable_api.table(base_id, "Allocations")
-        new_record = allocations_table.create({
+        new_record = _allocations_table().create({
             "Asset Link": [asset_record_id],
             "Scene Ref": scene_number,
             "Start Date": shoot_date,
@@ -417,21 +604,10 @@ def create_reservation(input: ReservationInput) -> ReservationOutput:
             "Status": "Confirmed"
         })
 
-        # Step 3: Update scene status in Notion
-        scene_updated = False
-        try:
-            notion.pages.update(
-                page_id=scene_id,
-                properties={
-                    "Logistics Status": {"select": {"name": "Reserved"}},
-                    "Est. Budget": {"number": total_cost}
-                }
-            )
-            scene_updated = True
-        except Exception:
-            pass  # Continue even if Notion update fails
+        # Step 3: Update scene status in Notion only once the allocation exists
+        scene_updated = _update_scene_status(scene_id, total_cost)
 
-        return ReservationOutput(
+        return ReservationOutput.model_construct(
             reservation_created=True,
             allocation_id=new_record["id"],
             asset_name=asset_name,
@@ -445,7 +621,7 @@ def create_reservation(input: ReservationInput) -> ReservationOutput:
         )
 
     except Exception as e:
-        return ReservationOutput(
+        return ReservationOutput.model_construct(
             reservation_created=False,
             asset_name=asset_name,
             scene_number=scene_number,